@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import sentence_transformers
@@ -47,3 +48,22 @@ class Embedder:
             list[float]: Embeddings for the text.
         """
         return self.embed_documents([text])[0]
+
+
+@lru_cache(maxsize=None)
+def get_embedder(model_name: str = "all-MiniLM-L6-v2", cache_folder: str | None = None) -> Embedder:
+    """
+    Return a cached Embedder instance for the given configuration.
+
+    Loading the SentenceTransformer weights is a multi-hundred-MB, seconds-long operation, so
+    call sites that need the same model within one process (or repeated runs in a notebook/REPL
+    session) share a single instance instead of loading a duplicate.
+
+    Args:
+        model_name (str): The name of the SentenceTransformer model to load.
+        cache_folder (str | None): The folder where the model weights are cached.
+
+    Returns:
+        Embedder: The shared Embedder instance for the configuration.
+    """
+    return Embedder(model_name=model_name, cache_folder=cache_folder)
@@ -193,10 +193,23 @@ class Chroma:
         Args:
             chunks (list): List of Document objects to add to the collection.
         """
-        texts = [clean(doc.page_content, no_emoji=True) for doc in chunks]
-        metadatas = [doc.metadata for doc in chunks]
+        self.from_soa(
+            texts=[doc.page_content for doc in chunks],
+            metadatas=[doc.metadata for doc in chunks],
+        )
+
+    def from_soa(self, texts: list[str], metadatas: list[dict] | None = None) -> None:
+        """
+        Adds a batch of chunks given as parallel lists of contents and metadata (structure of
+        arrays, e.g. from `TextSplitter.split_documents_soa`) to the Chroma collection.
+
+        Args:
+            texts (list[str]): List of chunk contents to add to the collection.
+            metadatas (list[dict], optional): List of metadata dictionaries corresponding to the
+                chunks. Defaults to None.
+        """
         self.from_texts(
-            texts=texts,
+            texts=[clean(text, no_emoji=True) for text in texts],
             metadatas=metadatas,
         )
 
@@ -205,6 +218,7 @@ class Chroma:
         query: str,
         k: int = 4,
         threshold: float | None = 0.2,
+        query_embedding: list[float] | None = None,
     ) -> tuple[list[Document], list[dict[str, Any]]]:
         """
         Performs similarity search on the given query.
@@ -220,6 +234,9 @@ class Chroma:
         threshold : float, optional
             The threshold for considering similarity scores (default is 0.2).
 
+        query_embedding : list[float], optional
+            Precomputed embedding of the query; when given, the query is not embedded again.
+
         Returns:
         -------
         tuple[list[Document], list[dict[str, Any]]]
@@ -228,7 +245,7 @@ class Chroma:
         """
         # `similarity_search_with_relevance_scores` return docs and relevance scores in the range [0, 1].
         # 0 is dissimilar, 1 is most similar.
-        docs_and_scores = self.similarity_search_with_relevance_scores(query, k)
+        docs_and_scores = self.similarity_search_with_relevance_scores(query, k, query_embedding=query_embedding)
 
         if threshold is not None:
             docs_and_scores = [doc for doc in docs_and_scores if doc[1] > threshold]
@@ -250,7 +267,13 @@ class Chroma:
 
         return retrieved_contents, sources
 
-    def similarity_search(self, query: str, k: int = 4, filter: dict[str, str] | None = None) -> list[Document]:
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, str] | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> list[Document]:
         """
         Run similarity search with Chroma.
 
@@ -258,11 +281,13 @@ class Chroma:
             query (str): Query text to search for.
             k (int): Number of results to return. Defaults to 4.
             filter (dict[str, str]|None): Filter by metadata. Defaults to None.
+            query_embedding (list[float]|None): Precomputed embedding of the query; when given,
+                the query is not embedded again. Defaults to None.
 
         Returns:
             List[Document]: List of documents most similar to the query text.
         """
-        docs_and_scores = self.similarity_search_with_score(query, k, filter=filter)
+        docs_and_scores = self.similarity_search_with_score(query, k, filter=filter, query_embedding=query_embedding)
         return [doc for doc, _ in docs_and_scores]
 
     def similarity_search_with_score(
@@ -271,6 +296,7 @@ class Chroma:
         k: int = 4,
         filter: dict[str, str] | None = None,
         where_document: dict[str, str] | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[tuple[Document, float]]:
         """
         Run similarity search with Chroma with distance.
@@ -280,14 +306,17 @@ class Chroma:
             k (int): Number of results to return. Defaults to 4.
             filter (dict[str, str]|None): Filter by metadata. Defaults to None.
             where_document (dict[str, str]|None): Filter by document content. Defaults to None.
-            **kwargs (Any): Additional keyword arguments.
+            query_embedding (list[float]|None): Precomputed embedding of the query; when given,
+                the query is not embedded again. Defaults to None.
 
         Returns:
             list[tuple[Document, float]]: List of documents most similar to
             the query text and cosine distance in float for each.
             Lower score represents more similarity.
         """
-        if self.embedding is None:
+        if query_embedding is None and self.embedding is not None:
+            query_embedding = self.embedding.embed_query(query)
+        if query_embedding is None:
             results = self.__query_collection(
                 query_texts=[query],
                 n_results=k,
@@ -295,7 +324,6 @@ class Chroma:
                 where_document=where_document,
             )
         else:
-            query_embedding = self.embedding.embed_query(query)
             results = self.__query_collection(
                 query_embeddings=[query_embedding],
                 n_results=k,
@@ -324,7 +352,9 @@ class Chroma:
             distance = metadata[distance_key]
         return get_relevance_score_fn(distance)
 
-    def similarity_search_with_relevance_scores(self, query: str, k: int = 4) -> list[tuple[Document, float]]:
+    def similarity_search_with_relevance_scores(
+        self, query: str, k: int = 4, query_embedding: list[float] | None = None
+    ) -> list[tuple[Document, float]]:
         """
         Return docs and relevance scores in the range [0, 1].
 
@@ -333,6 +363,8 @@ class Chroma:
         Args:
             query: input text
             k: Number of Documents to return. Defaults to 4.
+            query_embedding: Precomputed embedding of the query; when given, the query is not
+                embedded again. Defaults to None.
 
         Returns:
             List of Tuples of (doc, similarity_score)
@@ -340,7 +372,7 @@ class Chroma:
         # relevance_score_fn is a function to calculate relevance score from distance.
         relevance_score_fn = self.__select_relevance_score_fn()
 
-        docs_and_scores = self.similarity_search_with_score(query, k)
+        docs_and_scores = self.similarity_search_with_score(query, k, query_embedding=query_embedding)
         docs_and_similarities = [(doc, relevance_score_fn(score)) for doc, score in docs_and_scores]
         if any(similarity < 0.0 or similarity > 1.0 for _, similarity in docs_and_similarities):
             logger.warning("Relevance scores must be between" f" 0 and 1, got {docs_and_similarities}")
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 from bot.model.settings.llama import Llama31Settings, Llama31ToolSettings, Llama32OneSettings, Llama32ThreeSettings
 from bot.model.settings.openchat import OpenChat35Settings, OpenChat36Settings
@@ -19,28 +20,27 @@ class Model(Enum):
     LLAMA_3_2_three = "llama-3.2"
 
 
-SUPPORTED_MODELS = {
-    Model.STABLELM_ZEPHYR.value: StableLMZephyrSettings,
-    Model.OPENCHAT_3_5.value: OpenChat35Settings,
-    Model.OPENCHAT_3_6.value: OpenChat36Settings,
-    Model.STARLING.value: StarlingSettings,
-    Model.PHI_3_5.value: Phi35Settings,
-    Model.LLAMA_3_1.value: Llama31Settings,
-    Model.LLAMA_3_1_tool.value: Llama31ToolSettings,
-    Model.LLAMA_3_2_one.value: Llama32OneSettings,
-    Model.LLAMA_3_2_three.value: Llama32ThreeSettings,
+SUPPORTED_MODELS: dict[Model, type] = {
+    Model.STABLELM_ZEPHYR: StableLMZephyrSettings,
+    Model.OPENCHAT_3_5: OpenChat35Settings,
+    Model.OPENCHAT_3_6: OpenChat36Settings,
+    Model.STARLING: StarlingSettings,
+    Model.PHI_3_5: Phi35Settings,
+    Model.LLAMA_3_1: Llama31Settings,
+    Model.LLAMA_3_1_tool: Llama31ToolSettings,
+    Model.LLAMA_3_2_one: Llama32OneSettings,
+    Model.LLAMA_3_2_three: Llama32ThreeSettings,
 }
 
 
-def get_models():
-    return list(SUPPORTED_MODELS.keys())
+@lru_cache(maxsize=None)
+def get_models() -> list[str]:
+    return [model.value for model in SUPPORTED_MODELS]
 
 
-def get_model_settings(model_name: str):
-    model_settings = SUPPORTED_MODELS.get(model_name)
-
-    # validate input
-    if model_settings is None:
-        raise KeyError(model_name + " is a not supported model")
-
-    return model_settings
+def get_model_settings(model_name: str) -> type:
+    try:
+        # Model(...) adapts the CLI string to the enum key, validating it in the same step.
+        return SUPPORTED_MODELS[Model(model_name)]
+    except (KeyError, ValueError):
+        raise KeyError(model_name + " is a not supported model") from None
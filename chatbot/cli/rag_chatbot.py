@@ -7,7 +7,7 @@ from bot.client.lama_cpp_client import LamaCppClient
 from bot.conversation.chat_history import ChatHistory
 from bot.conversation.conversation_handler import answer_with_context, refine_question
 from bot.conversation.ctx_strategy import get_ctx_synthesis_strategies, get_ctx_synthesis_strategy
-from bot.memory.embedder import Embedder
+from bot.memory.embedder import get_embedder
 from bot.memory.vector_database.chroma import Chroma
 from bot.model.model_registry import Model, get_model_settings, get_models
 from helpers.log import get_logger
@@ -139,7 +139,7 @@ def main(parameters):
     synthesis_strategy = get_ctx_synthesis_strategy(parameters.synthesis_strategy, llm=llm)
     chat_history = ChatHistory(total_length=2)
 
-    embedding = Embedder()
+    embedding = get_embedder()
     index = Chroma(persist_directory=str(vector_store_path), embedding=embedding)
 
     loop(llm, chat_history, synthesis_strategy, index, parameters)
@@ -5,38 +5,42 @@ class Format(Enum):
     MARKDOWN = "markdown"
 
 
-SUPPORTED_FORMATS = {
-    Format.MARKDOWN.value: [
-        # First, try to split along Markdown headings (starting with level 2)
-        "\n#{1,6} ",
-        # Note the alternative syntax for headings (below) is not handled here
-        # Heading level 2
-        # ---------------
-        # End of code block
-        "```\n",
-        # Horizontal lines
-        "\n\\*\\*\\*+\n",
-        "\n---+\n",
-        "\n___+\n",
-        # Note that this splitter doesn't handle horizontal lines defined
-        # by *three or more* of ***, ---, or ___, but this is not handled
-        "\n\n",
-        "\n",
-        " ",
-        "",
-    ]
+# Separator hierarchies are immutable module-level tuples, so repeated get_separators calls in
+# indexing loops hand out the same cached object instead of rebuilding a list of strings.
+_MARKDOWN_SEPARATORS: tuple[str, ...] = (
+    # First, try to split along Markdown headings (starting with level 2)
+    "\n#{1,6} ",
+    # Note the alternative syntax for headings (below) is not handled here
+    # Heading level 2
+    # ---------------
+    # End of code block
+    "```\n",
+    # Horizontal lines
+    "\n\\*\\*\\*+\n",
+    "\n---+\n",
+    "\n___+\n",
+    # Note that this splitter doesn't handle horizontal lines defined
+    # by *three or more* of ***, ---, or ___, but this is not handled
+    "\n\n",
+    "\n",
+    " ",
+    "",
+)
+
+SUPPORTED_FORMATS: dict[str, tuple[str, ...]] = {
+    Format.MARKDOWN.value: _MARKDOWN_SEPARATORS,
 }
 
 
-def get_separators(format: str):
+def get_separators(format: str) -> tuple[str, ...]:
     """
-    Retrieve the list of separators for a given format.
+    Retrieve the separators for a given format.
 
     Args:
         format (str): The format for which to retrieve separators.
 
     Returns:
-        list[str]: A list of separators for the specified format.
+        tuple[str, ...]: The separators for the specified format.
 
     Raises:
         KeyError: If the format is not supported.
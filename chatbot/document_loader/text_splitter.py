@@ -22,18 +22,32 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import copy
+import concurrent.futures
 import logging
+import mmap
+import os
+import pickle
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Iterable
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from entities.document import Document
 
 from document_loader.format import get_separators
 
+try:
+    from semantic_text_splitter import MarkdownSplitter
+except ImportError:
+    MarkdownSplitter = None
+
 logger = logging.getLogger(__name__)
 
+# Documents are chunked independently, so above this count the splitting is spread across CPU
+# cores; below it the process-pool startup cost outweighs the near-linear speedup.
+_PARALLEL_SPLIT_THRESHOLD = 16
+
 
 class TextSplitter(ABC):
     """
@@ -46,6 +60,7 @@ class TextSplitter(ABC):
         chunk_size: int = 1000,
         chunk_overlap: int = 50,
         length_function: Callable[[str], int] = len,
+        length_function_batch: Callable[[list[str]], list[int]] | None = None,
         keep_separator: bool = False,
         add_start_index: bool = False,
         strip_whitespace: bool = True,
@@ -58,6 +73,12 @@ class TextSplitter(ABC):
                            between adjacent chunks. A small overlap ensures that critical information is not lost at
                            the boundaries of chunks.
             length_function: Function that measures the length of given chunks.
+            length_function_batch: Optional batched variant of `length_function` that measures a list of chunks in
+                                   one call. Worth providing when the length function is a tokenizer, so the
+                                   Python-to-native boundary is crossed once per batch of splits instead of once
+                                   per split. When provided without a custom `length_function`, single-string
+                                   measurements (e.g. of separators) are derived from it, so every length is
+                                   expressed in the same units.
             keep_separator: Whether to keep the separator in the chunks.
             add_start_index: If `True`, includes chunk's start index in metadata.
             strip_whitespace: If `True`, strips whitespace from the start and end of every document.
@@ -69,28 +90,139 @@ class TextSplitter(ABC):
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
         self._length_function = length_function
+        self._length_function_batch = length_function_batch
         self._keep_separator = keep_separator
         self._add_start_index = add_start_index
         self._strip_whitespace = strip_whitespace
+        # Runtime specialization of the split measurement: a batch function measures a whole level
+        # in one call, and the dominant default `length_function is len` runs entirely in C via
+        # map() instead of a Python-level loop with an attribute load and call per split.
+        if length_function_batch is not None:
+            self._measure_splits = length_function_batch
+            if length_function is len:
+                # A batch function without a matching scalar one would measure separators in
+                # characters while the splits are measured in e.g. tokens; derive the scalar from
+                # the batch function so the chunk-size accounting stays in one unit.
+                self._length_function = self._measure_one_batched
+        elif length_function is len:
+            self._measure_splits = self._measure_splits_len
+        else:
+            self._measure_splits = self._measure_splits_generic
 
     @abstractmethod
     def split_text(self, text: str) -> list[str]:
         """Split text into multiple components."""
 
-    def create_documents(self, texts: list[str], metadatas: list[dict] | None = None) -> list[Document]:
-        """Create documents from a list of texts."""
+    def split_text_with_start_indexes(self, text: str) -> list[tuple[str, int]]:
+        """
+        Split text into chunks paired with the start index of each chunk in the text.
+
+        This fallback locates each chunk with `text.find`; subclasses that know the chunk offsets
+        at split time override it with an O(1) lookup per chunk.
+        """
+        chunks = []
+        index = -1
+        for chunk in self.split_text(text):
+            index = text.find(chunk, index + 1)
+            chunks.append((chunk, index))
+        return chunks
+
+    def split_file(self, path: Path | str, block_size: int = 1 << 20) -> Iterator[str]:
+        """
+        Splits a file into chunks without loading the whole file into a Python string.
+
+        The file is memory-mapped and carved into blocks of roughly `block_size` bytes, each cut
+        at a blank-line boundary (an ASCII byte sequence, hence a safe cut point in UTF-8 text).
+        Each block is decoded and split on its own and its chunks are yielded as they are
+        produced, so peak memory is one block plus its chunks instead of the whole file. This
+        makes corpora larger than RAM splittable.
+
+        Note that chunks never span two blocks: a merge that would have packed text across a
+        block boundary ends there instead. With the default 1 MiB blocks this affects a
+        negligible number of boundaries.
+
+        Args:
+            path (Path | str): The path of the file to split.
+            block_size (int): The target block size in bytes. Defaults to 1 MiB.
+
+        Yields:
+            str: The chunks of the file, in file order.
+        """
+        size = os.path.getsize(path)
+        if size == 0:
+            return
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = min(start + block_size, size)
+                if end < size:
+                    cut = mm.rfind(b"\n\n", start, end)
+                    if cut > start:
+                        end = cut + 2
+                    else:
+                        # No blank line in this block: extend to the next one (or the file end).
+                        cut = mm.find(b"\n\n", end)
+                        end = cut + 2 if cut != -1 else size
+                yield from self.split_text(mm[start:end].decode("utf-8"))
+                start = end
+
+    def _split_texts_soa(self, texts: list[str], metadatas: list[dict] | None = None) -> tuple[list[str], list[dict]]:
+        """
+        Splits texts into parallel lists of chunk contents and chunk metadata (structure of
+        arrays). Keeping the in-flight state as plain lists avoids allocating a Document object
+        per chunk until one is actually requested, and downstream embedding calls want a
+        `list[str]` anyway.
+        """
         _metadatas = metadatas or [{}] * len(texts)
-        documents = []
-        for i, text in enumerate(texts):
-            index = -1
+        if len(texts) > _PARALLEL_SPLIT_THRESHOLD:
+            try:
+                return self._split_texts_soa_parallel(texts, _metadatas)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                # e.g. a lambda length function: the splitter cannot be shipped to the workers.
+                logger.warning("Splitter configuration is not picklable, splitting sequentially")
+        page_contents: list[str] = []
+        metas: list[dict] = []
+        for text, source_metadata in zip(texts, _metadatas):
+            chunks, chunk_metas = self._split_one_text(text, source_metadata)
+            page_contents.extend(chunks)
+            metas.extend(chunk_metas)
+        return page_contents, metas
+
+    def _split_one_text(self, text: str, source_metadata: dict) -> tuple[list[str], list[dict]]:
+        """Splits a single text, returning parallel lists of chunk contents and chunk metadata."""
+        page_contents: list[str] = []
+        metas: list[dict] = []
+        # Metadata dicts are flat (string/int values), so a shallow copy is enough and
+        # avoids a deepcopy walk per chunk.
+        if self._add_start_index:
+            for chunk, start_index in self.split_text_with_start_indexes(text):
+                metadata = dict(source_metadata)
+                metadata["start_index"] = start_index
+                page_contents.append(chunk)
+                metas.append(metadata)
+        else:
             for chunk in self.split_text(text):
-                metadata = copy.deepcopy(_metadatas[i])
-                if self._add_start_index:
-                    index = text.find(chunk, index + 1)
-                    metadata["start_index"] = index
-                new_doc = Document(page_content=chunk, metadata=metadata)
-                documents.append(new_doc)
-        return documents
+                page_contents.append(chunk)
+                metas.append(dict(source_metadata))
+        return page_contents, metas
+
+    def _split_texts_soa_parallel(self, texts: list[str], metadatas: list[dict]) -> tuple[list[str], list[dict]]:
+        """
+        Splits the texts across CPU cores with a process pool; each document's chunking is
+        independent, so large corpora scale near-linearly with the core count.
+        """
+        page_contents: list[str] = []
+        metas: list[dict] = []
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for chunks, chunk_metas in executor.map(self._split_one_text, texts, metadatas):
+                page_contents.extend(chunks)
+                metas.extend(chunk_metas)
+        return page_contents, metas
+
+    def create_documents(self, texts: list[str], metadatas: list[dict] | None = None) -> list[Document]:
+        """Create documents from a list of texts."""
+        page_contents, metas = self._split_texts_soa(texts, metadatas)
+        return [Document(page_content=chunk, metadata=metadata) for chunk, metadata in zip(page_contents, metas)]
 
     def split_documents(self, documents: Iterable[Document]) -> list[Document]:
         """Split documents."""
@@ -100,58 +232,144 @@ class TextSplitter(ABC):
             metadatas.append(doc.metadata)
         return self.create_documents(texts, metadatas=metadatas)
 
-    def _join_docs(self, docs: list[str], separator: str) -> str | None:
+    def split_documents_soa(self, documents: Iterable[Document]) -> tuple[list[str], list[dict]]:
         """
-        Joins a list of document strings using the specified separator.
+        Splits documents into parallel lists of chunk contents and chunk metadata, without
+        constructing a Document object per chunk. Callers that feed the chunks straight into an
+        embedding/indexing step should prefer this over `split_documents`.
+        """
+        texts, metadatas = [], []
+        for doc in documents:
+            texts.append(doc.page_content)
+            metadatas.append(doc.metadata)
+        return self._split_texts_soa(texts, metadatas)
 
-        Args:
-            docs (list[str]): The list of document strings to join.
-            separator (str): The separator to use for joining the document strings.
+    @staticmethod
+    def _measure_splits_len(splits: list[str]) -> list[int]:
+        """Fast path bound to `_measure_splits` when the length function is the builtin `len`."""
+        return list(map(len, splits))
 
-        Returns:
-            str | None: The joined document string, or None if the resulting string is empty.
-        """
-        text = separator.join(docs)
-        if self._strip_whitespace:
-            text = text.strip()
-        if text == "":
-            return None
-        else:
-            return text
+    def _measure_splits_generic(self, splits: list[str]) -> list[int]:
+        """Generic path bound to `_measure_splits` for custom length functions."""
+        return [self._length_function(s) for s in splits]
+
+    def _measure_one_batched(self, text: str) -> int:
+        """Scalar length bound to `_length_function` when only the batched variant is supplied."""
+        return self._length_function_batch([text])[0]
 
-    def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
-        # We now want to combine these smaller pieces into medium size
-        # chunks to send to the LLM.
-        separator_len = self._length_function(separator)
-        docs, current_doc = [], []
+    def _merge_splits(
+        self,
+        splits: Iterable[str],
+        separator: str,
+        offsets: Iterable[int] | None = None,
+        lens: Iterable[int] | None = None,
+        separators: Iterable[str] | None = None,
+    ) -> list[str] | list[tuple[str, int]]:
+        """
+        Combines the smaller pieces into medium size chunks to send to the LLM.
+
+        The splits in a chunk are joined with `separator`, unless `separators` holds the separator
+        that preceded each split in the source text (as `_split_text` records with
+        `keep_separator=False`): then every split after the first in a chunk is preceded by its
+        own separator, so splits produced at different separator levels are rejoined with the
+        separator that was actually removed between them.
+
+        When `offsets` holds the start index of each split, the merged chunks are returned as
+        `(chunk, start_index)` tuples, where the start index is the offset of the first split of
+        the chunk (adjusted for stripped leading whitespace). When `lens` holds the precomputed
+        length of each split, the length function is not invoked again.
+        """
+        length_function = self._length_function
+        separator_len = length_function(separator)
+        docs = []
+        # A deque makes the overlap eviction below O(1) per popped split, and the parallel deques
+        # of cached lengths, offsets and separators avoid any re-computation on eviction.
+        current_doc: deque[str] = deque()
+        current_lens: deque[int] = deque()
+        current_offsets: deque[int] = deque()
+        current_seps: deque[str] | None = deque() if separators is not None else None
+        current_sep_lens: deque[int] = deque()
+        offsets = iter(offsets) if offsets is not None else None
+        lens = iter(lens) if lens is not None else None
+        separators = iter(separators) if separators is not None else None
+        sep_len_cache: dict[str, int] = {}
         total = 0
+        # Hot loop: keep the chunk bounds in locals rather than re-reading them off self.
+        chunk_size = self._chunk_size
+        chunk_overlap = self._chunk_overlap
 
         for d in splits:
-            _len = self._length_function(d)
-            if total + _len + (separator_len if len(current_doc) > 0 else 0) > self._chunk_size:
-                if total > self._chunk_size:
+            _len = next(lens) if lens is not None else length_function(d)
+            if separators is not None:
+                sep = next(separators)
+                sep_len = sep_len_cache.get(sep)
+                if sep_len is None:
+                    sep_len = sep_len_cache[sep] = length_function(sep)
+            else:
+                sep_len = separator_len
+            if total + _len + (sep_len if current_doc else 0) > chunk_size:
+                if total > chunk_size:
                     logger.warning(
-                        f"Created a chunk of size {total}, " f"which is longer than the specified {self._chunk_size}"
+                        f"Created a chunk of size {total}, " f"which is longer than the specified {chunk_size}"
                     )
-                if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
-                    if doc is not None:
-                        docs.append(doc)
+                if current_doc:
+                    self._emit_doc(current_doc, separator, current_offsets, docs, current_seps)
                     # Keep on popping if:
                     # - we have a larger chunk than in the chunk overlap
                     # - or if we still have any chunks and the length is long
-                    while total > self._chunk_overlap or (
-                        total + _len + (separator_len if len(current_doc) > 0 else 0) > self._chunk_size and total > 0
+                    while total > chunk_overlap or (
+                        total + _len + (sep_len if current_doc else 0) > chunk_size and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (separator_len if len(current_doc) > 1 else 0)
-                        current_doc = current_doc[1:]
+                        current_doc.popleft()
+                        if current_offsets:
+                            current_offsets.popleft()
+                        if current_seps is not None:
+                            current_seps.popleft()
+                        # The popped split's own separator was never counted; the separator that
+                        # joined it to the next split is the next split's, now the leading one.
+                        current_sep_lens.popleft()
+                        total -= current_lens.popleft() + (current_sep_lens[0] if current_doc else 0)
             current_doc.append(d)
-            total += _len + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
-        if doc is not None:
-            docs.append(doc)
+            current_lens.append(_len)
+            current_sep_lens.append(sep_len)
+            if offsets is not None:
+                current_offsets.append(next(offsets))
+            if current_seps is not None:
+                current_seps.append(sep)
+            total += _len + (sep_len if len(current_doc) > 1 else 0)
+        self._emit_doc(current_doc, separator, current_offsets, docs, current_seps)
         return docs
 
+    def _emit_doc(
+        self,
+        current_doc: deque[str],
+        separator: str,
+        current_offsets: deque[int],
+        docs: list,
+        current_seps: deque[str] | None = None,
+    ) -> None:
+        """Joins the accumulated splits and appends the resulting chunk (if any) to `docs`."""
+        if current_seps is None:
+            text = separator.join(current_doc)
+        else:
+            # Each split is preceded by its own removed separator, except the first, whose
+            # separator joined it to the previous chunk.
+            parts: list[str] = []
+            for piece, sep in zip(current_doc, current_seps):
+                if parts:
+                    parts.append(sep)
+                parts.append(piece)
+            text = "".join(parts)
+        start_index = current_offsets[0] if current_offsets else None
+        if self._strip_whitespace:
+            stripped = text.strip()
+            if start_index is not None:
+                start_index += len(text) - len(text.lstrip())
+            text = stripped
+        if text == "":
+            return
+        docs.append(text if start_index is None else (text, start_index))
+
 
 class RecursiveCharacterTextSplitter(TextSplitter):
     """
@@ -163,19 +381,61 @@ class RecursiveCharacterTextSplitter(TextSplitter):
 
     def __init__(
         self,
-        separators: list[str] | None = None,
+        separators: Sequence[str] | None = None,
         keep_separator: bool = True,
         is_separator_regex: bool = False,
         **kwargs: Any,
     ) -> None:
         """Create a new TextSplitter."""
         super().__init__(keep_separator=keep_separator, **kwargs)
-        self._separators = separators or ["\n\n", "\n", " ", ""]
+        self._separators = list(separators) if separators else ["\n\n", "\n", " ", ""]
         self._is_separator_regex = is_separator_regex
+        # Escape and compile each separator once at construction: `_split_text` probes the same
+        # separators on every recursion level, so recompiling them per call (as `re.search`/`re.split`
+        # with string patterns do) dominates the hot chunking path on large corpora.
+        # Each entry is `(separator, search_pattern, split_pattern)` where `split_pattern` wraps the
+        # separator in a capture group so splitting can keep the separators in the result.
+        self._compiled_separators: list[tuple[str, re.Pattern | None, re.Pattern | None]] = []
+        for separator in self._separators:
+            if separator == "":
+                self._compiled_separators.append((separator, None, None))
+                continue
+            pattern = separator if self._is_separator_regex else re.escape(separator)
+            self._compiled_separators.append((separator, re.compile(pattern), re.compile(f"({pattern})")))
+
+    def _select_separator(self, text: str, separator_index: int) -> tuple[str, re.Pattern | None, int]:
+        """
+        Picks the first separator in priority order that occurs in the text. Each probe is one
+        C-level `search` of a pattern compiled at construction, so a level that matches its first
+        or second separator costs one or two scans of the text with no Python-level iteration
+        over the individual matches.
+
+        Args:
+            text (str): The text to be split.
+            separator_index (int): Index of the first separator to consider.
 
-    def _split_text(self, text: str, separators: list[str]) -> list[str]:
+        Returns:
+            tuple[str, re.Pattern | None, int]: The chosen separator, its compiled split pattern
+            and the separator index deeper recursion levels should start from.
+        """
+        separators = self._compiled_separators
+        n = len(separators)
+        for j in range(separator_index, n):
+            separator, search_pattern, split_pattern = separators[j]
+            if search_pattern is None:
+                # Empty separator: split into single characters, nothing deeper to recurse into.
+                return separator, split_pattern, n
+            if search_pattern.search(text):
+                return separator, split_pattern, j + 1
+        # No separator occurs in the text: keep the last one with no deeper levels, so oversize
+        # splits are emitted as they are.
+        separator, _, split_pattern = separators[-1]
+        return separator, split_pattern, n
+
+    def _split_text(self, text: str, separator_index: int) -> list[tuple[str, int]]:
         """
-        Given a large text it recursively tries to split it based on a specified chunk size.
+        Given a large text it tries to split it based on a specified chunk size, returning the
+        chunks together with their start index in the text.
         It does this by using a set of characters. The default characters provided to it are ["\n\n", "\n", " ", ""].
         It takes in the large text then tries to split it by the first character \n\n.
         If the first split by \n\n is still large then it moves to the next character which is \n and tries to split
@@ -183,89 +443,190 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         If it is still larger than our specified chunk size it moves to the next character in the set until we get a
         split that is less than our specified chunk size.
 
+        Oversize splits are subdivided through the deeper separator levels before anything is
+        merged, so their fragments are packed together with the surrounding splits into one stream
+        of chunks. This keeps chunks as close to the chunk size as possible (fewer chunks, and
+        fewer embeddings downstream) instead of flushing a short chunk every time an oversize
+        split is encountered. With `keep_separator=False` each split carries the separator that
+        was removed before it at its own level, so the merge rejoins splits from different levels
+        with the right separator instead of a single top-level one. The descent is driven by an
+        explicit work stack rather than recursion, which avoids the Python call overhead of a
+        recursive implementation on deep hierarchies.
+
         More details here https://dev.to/eteimz/understanding-langchains-recursivecharactertextsplitter-2846
         """
-        final_chunks = []
-        # Get appropriate separator to use
-        separator = separators[-1]
-        new_separators = []
-        for i, _s in enumerate(separators):
-            _separator = _s if self._is_separator_regex else re.escape(_s)
-            if _s == "":
-                separator = _s
-                break
-            if re.search(_separator, text):
-                separator = _s
-                new_separators = separators[i + 1 :]
-                break
-
-        _separator = separator if self._is_separator_regex else re.escape(separator)
-        splits = self._split_text_with_regex(text, _separator, self._keep_separator)
-
-        # Now go merging things, recursively splitting longer texts.
-        _good_splits = []
-        _separator = "" if self._keep_separator else separator
-        for s in splits:
-            if self._length_function(s) < self._chunk_size:
-                _good_splits.append(s)
-            else:
-                if _good_splits:
-                    merged_text = self._merge_splits(_good_splits, _separator)
-                    final_chunks.extend(merged_text)
-                    _good_splits = []
-                if not new_separators:
-                    final_chunks.append(s)
-                else:
-                    other_info = self._split_text(s, new_separators)
-                    final_chunks.extend(other_info)
-        if _good_splits:
-            merged_text = self._merge_splits(_good_splits, _separator)
-            final_chunks.extend(merged_text)
+        final_chunks: list[tuple[str, int]] = []
+        n = len(self._compiled_separators)
+        good_splits: list[str] = []
+        good_offsets: list[int] = []
+        good_lens: list[int] = []
+        # This loop is the CPU-bound core of the splitter: keep the hot attributes in locals so
+        # each iteration pays a fast local load instead of repeated attribute lookups on self.
+        chunk_size = self._chunk_size
+        keep_separator = self._keep_separator
+        select_separator = self._select_separator
+        split_text_with_regex = self._split_text_with_regex
+        measure_splits = self._measure_splits
+        # With keep_separator the separators stay inside the splits and the merge joins with
+        # nothing; otherwise each split's removed separator is tracked alongside it.
+        good_seps: list[str] | None = None if keep_separator else []
+        # LIFO work stack of (piece, start index in the original text, separator index, length,
+        # separator removed before the piece); the splits of a piece are pushed back in reverse so
+        # they are consumed in document order. Lengths are measured once per level, batched when a
+        # batch length function is available. A separator index of `n` marks a piece that cannot
+        # be split further.
+        work: list[tuple[str, int, int, int, str]] = [(text, 0, separator_index, measure_splits([text])[0], "")]
+        while work:
+            piece, start, index, piece_len, pre_sep = work.pop()
+            if piece_len < chunk_size:
+                good_splits.append(piece)
+                good_offsets.append(start)
+                good_lens.append(piece_len)
+                if good_seps is not None:
+                    good_seps.append(pre_sep)
+                continue
+            if index >= n:
+                # Unsplittable oversize piece: emit it on its own, after the chunks packed so far.
+                if good_splits:
+                    final_chunks.extend(self._merge_splits(good_splits, "", good_offsets, good_lens, good_seps))
+                    good_splits.clear()
+                    good_offsets.clear()
+                    good_lens.clear()
+                    if good_seps is not None:
+                        good_seps.clear()
+                final_chunks.append((piece, start))
+                continue
+            level_separator, split_pattern, new_index = select_separator(piece, index)
+            splits, offsets = split_text_with_regex(piece, split_pattern, keep_separator)
+            if len(splits) == 1 and splits[0] == piece:
+                # No separator of this level occurs in the piece: retry at the deeper levels.
+                work.append((piece, start, new_index, piece_len, pre_sep))
+                continue
+            lens = measure_splits(splits)
+            # The first split inherits the piece's removed separator; the separator before every
+            # later split was removed at this level.
+            for i in range(len(splits) - 1, -1, -1):
+                work.append(
+                    (
+                        splits[i],
+                        start + offsets[i],
+                        new_index,
+                        lens[i],
+                        pre_sep if i == 0 else ("" if keep_separator else level_separator),
+                    )
+                )
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, "", good_offsets, good_lens, good_seps))
         return final_chunks
 
     def split_text(self, text: str) -> list[str]:
-        return self._split_text(text, self._separators)
+        return [chunk for chunk, _ in self._split_text(text, 0)]
+
+    def split_text_with_start_indexes(self, text: str) -> list[tuple[str, int]]:
+        """
+        Split text into chunks paired with the start index of each chunk in the text.
+
+        The indexes come from the separator spans recorded while splitting, so no text search
+        is needed.
+        """
+        return self._split_text(text, 0)
 
     @staticmethod
-    def _split_text_with_regex(text: str, separator: str, keep_separator: bool) -> list[str]:
+    def _split_text_with_regex(
+        text: str, split_pattern: re.Pattern | None, keep_separator: bool
+    ) -> tuple[list[str], list[int]]:
         """
-        Splits the input text using the specified separator.
+        Splits the input text using the specified precompiled separator pattern.
 
         Args:
             text (str): The text to be split.
-            separator (str): The separator to use for splitting the text.
+            split_pattern (re.Pattern | None): The compiled separator pattern, wrapping the separator
+                in a capture group; None stands for the empty separator (split into characters).
             keep_separator (bool): If True, the separator is included in the resulting splits.
 
         Returns:
-            List[str]: A list of strings resulting from the split operation.
+            tuple[list[str], list[int]]: The splits and the start index of each split in the text.
 
         """
-        # Now that we have the separator, split the text
-        if separator:
-            if keep_separator:
-                # The parentheses in the pattern keep the delimiters in the result.
-                _splits = re.split(f"({separator})", text)
-                splits = [_splits[i] + _splits[i + 1] for i in range(1, len(_splits), 2)]
-                if len(_splits) % 2 == 0:
-                    splits += _splits[-1:]
-                splits = [_splits[0]] + splits
-            else:
-                splits = re.split(separator, text)
-        else:
-            splits = list(text)
-        return [s for s in splits if s != ""]
+        if split_pattern is None:
+            return list(text), list(range(len(text)))
+        # A single pass over the separator spans slices the text directly, avoiding the
+        # intermediate list built by re.split and the extra Python passes that reattached the
+        # separators and filtered out empty strings. The spans also give each split's start index
+        # for free, which spares the O(text * chunks) `text.find` calls downstream.
+        splits: list[str] = []
+        offsets: list[int] = []
+        prev_end = 0
+        prev_start = 0
+        prev_separator = ""
+        for match in split_pattern.finditer(text):
+            piece = prev_separator + text[prev_end : match.start()]
+            if piece:
+                splits.append(piece)
+                offsets.append(prev_start)
+            # When keeping separators, each separator is attached to the front of the split that
+            # follows it, so that split starts where the separator does.
+            prev_separator = match.group() if keep_separator else ""
+            prev_start = match.start() if keep_separator else match.end()
+            prev_end = match.end()
+        piece = prev_separator + text[prev_end:]
+        if piece:
+            splits.append(piece)
+            offsets.append(prev_start)
+        return splits, offsets
+
+
+class RustRecursiveCharacterTextSplitter(TextSplitter):
+    """
+    Markdown-aware splitter backed by the Rust `semantic-text-splitter` package, which chunks
+    CPU-bound workloads one to two orders of magnitude faster than the pure-Python splitter while
+    exposing the same Document API.
+
+    Requires the optional dependency `semantic-text-splitter` (`pip install semantic-text-splitter`).
+    """
 
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 50, **kwargs: Any) -> None:
+        """Create a new TextSplitter backed by the Rust MarkdownSplitter."""
+        if MarkdownSplitter is None:
+            raise ImportError(
+                "The rust backend requires the optional dependency semantic-text-splitter. "
+                "Install it with `pip install semantic-text-splitter`."
+            )
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap, **kwargs)
+        self._splitter = MarkdownSplitter(chunk_size, overlap=chunk_overlap, trim=self._strip_whitespace)
 
-def create_recursive_text_splitter(format: str, **kwargs: Any) -> RecursiveCharacterTextSplitter:
+    def split_text(self, text: str) -> list[str]:
+        return list(self._splitter.chunks(text))
+
+    def split_text_with_start_indexes(self, text: str) -> list[tuple[str, int]]:
+        """
+        Split text into chunks paired with the start index of each chunk in the text, taken
+        directly from the offsets reported by the Rust splitter.
+        """
+        return [(chunk, offset) for offset, chunk in self._splitter.chunk_indices(text)]
+
+
+def create_recursive_text_splitter(format: str, backend: str = "python", **kwargs: Any) -> TextSplitter:
     """
-    Factory function to create a RecursiveCharacterTextSplitter instance based on the specified format.
+    Factory function to create a text splitter instance based on the specified format.
 
     Args:
         format (Format): The format of the text to be split.
-        **kwargs (Any): Additional keyword arguments to be passed to the RecursiveCharacterTextSplitter constructor.
+        backend (str): Either "python" (default) for the pure-Python RecursiveCharacterTextSplitter
+            or "rust" for the splitter backed by the optional `semantic-text-splitter` package.
+        **kwargs (Any): Additional keyword arguments to be passed to the splitter constructor.
 
     Returns:
-        An instance of RecursiveCharacterTextSplitter configured with the appropriate separators.
+        An instance of TextSplitter configured with the appropriate separators.
+
+    Raises:
+        ValueError: If the backend is not supported.
+        ImportError: If the rust backend is requested but `semantic-text-splitter` is not installed.
     """
+    # Validates the format even when the separators are not needed by the backend.
     separators = get_separators(format)
+    if backend == "rust":
+        return RustRecursiveCharacterTextSplitter(**kwargs)
+    if backend != "python":
+        raise ValueError(backend + " is a not supported backend")
     return RecursiveCharacterTextSplitter(separators=separators, **kwargs)
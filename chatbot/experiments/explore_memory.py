@@ -1,7 +1,7 @@
 from pathlib import Path
 
 import chromadb
-from bot.memory.embedder import Embedder
+from bot.memory.embedder import get_embedder
 from bot.memory.vector_database.chroma import Chroma
 from helpers.prettier import prettify_source
 
@@ -12,7 +12,7 @@ if __name__ == "__main__":
     # Contains an extract of things the user said in the past;
     episodic_vector_store_path = root_folder / "vector_store" / "episodic_index"
 
-    embedding = Embedder()
+    embedding = get_embedder()
     index = Chroma(persist_directory=str(declarative_vector_store_path), embedding=embedding)
 
     # query = "<write_your_query_here>"
@@ -25,20 +25,36 @@ if __name__ == "__main__":
 
     persistent_client = chromadb.PersistentClient(path=str(episodic_vector_store_path))
     collection = persistent_client.get_or_create_collection("episodic_memory")
-    collection.add(ids=["1", "2", "3"], documents=["a", "b", "c"])
+    # Embed the documents in one batched encoder pass and hand the vectors to Chroma; otherwise
+    # collection.add embeds them internally with Chroma's default embedder, which is both an extra
+    # model load and a different embedding space from the one used to query below.
+    episodic_documents = ["a", "b", "c"]
+    collection.add(
+        ids=["1", "2", "3"],
+        documents=episodic_documents,
+        embeddings=embedding.embed_documents(episodic_documents),
+    )
     chroma = Chroma(
         client=persistent_client,
         collection_name="episodic_memory",
         embedding=embedding,
     )
-    docs = chroma.similarity_search("a")
-    docs_with_score = chroma.similarity_search_with_score("a")
-    docs_with_relevance_score = chroma.similarity_search_with_relevance_scores("a")
+    # Encoding the query through the embedding model dominates lookup latency, so embed it once
+    # and reuse the vector across all the searches below instead of re-embedding it per call.
+    episodic_query = "a"
+    episodic_query_embedding = embedding.embed_query(episodic_query)
+    docs = chroma.similarity_search(episodic_query, query_embedding=episodic_query_embedding)
+    docs_with_score = chroma.similarity_search_with_score(episodic_query, query_embedding=episodic_query_embedding)
+    docs_with_relevance_score = chroma.similarity_search_with_relevance_scores(
+        episodic_query, query_embedding=episodic_query_embedding
+    )
     matched_doc = max(docs_with_relevance_score, key=lambda x: x[1])
 
     # The returned distance score is cosine distance. Therefore, a lower score is better.
+    # Querying with the precomputed vector also keeps the lookup in the same embedding space as
+    # the Chroma wrapper above, instead of falling back to Chroma's default embedder.
     results = collection.query(
-        query_texts=["a"],
+        query_embeddings=[episodic_query_embedding],
         n_results=2,
         # where={"metadata_field": "is_equal_to_this"}, # optional filter
         # where_document={"$contains":"search_string"}  # optional filter
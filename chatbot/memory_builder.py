@@ -2,7 +2,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from bot.memory.embedder import Embedder
+from bot.memory.embedder import get_embedder
 from bot.memory.vector_database.chroma import Chroma
 from document_loader.format import Format
 from document_loader.loader import DirectoryLoader
@@ -31,7 +31,7 @@ def load_documents(docs_path: Path) -> list[Document]:
     return loader.load()
 
 
-def split_chunks(sources: list, chunk_size: int = 512, chunk_overlap: int = 25) -> list:
+def split_chunks(sources: list, chunk_size: int = 512, chunk_overlap: int = 25) -> tuple[list[str], list[dict]]:
     """
     Splits a list of sources into smaller chunks.
 
@@ -41,15 +41,12 @@ def split_chunks(sources: list, chunk_size: int = 512, chunk_overlap: int = 25)
         chunk_overlap (int, optional): The amount of overlap between consecutive chunks. Defaults to 0.
 
     Returns:
-        List: A list of smaller chunks obtained from the input sources.
+        tuple[list[str], list[dict]]: Parallel lists of chunk contents and chunk metadata.
     """
-    chunks = []
     splitter = create_recursive_text_splitter(
         format=Format.MARKDOWN.value, chunk_size=chunk_size, chunk_overlap=chunk_overlap
     )
-    for chunk in splitter.split_documents(sources):
-        chunks.append(chunk)
-    return chunks
+    return splitter.split_documents_soa(sources)
 
 
 def build_memory_index(docs_path: Path, vector_store_path: str, chunk_size: int, chunk_overlap: int):
@@ -58,13 +55,13 @@ def build_memory_index(docs_path: Path, vector_store_path: str, chunk_size: int,
     logger.info(f"Number of loaded documents: {len(sources)}")
 
     logger.info("Chunking documents...")
-    chunks = split_chunks(sources, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    logger.info(f"Number of generated chunks: {len(chunks)}")
+    texts, metadatas = split_chunks(sources, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    logger.info(f"Number of generated chunks: {len(texts)}")
 
     logger.info("Creating memory index...")
-    embedding = Embedder()
+    embedding = get_embedder()
     vector_database = Chroma(persist_directory=str(vector_store_path), embedding=embedding)
-    vector_database.from_chunks(chunks)
+    vector_database.from_soa(texts, metadatas)
     logger.info("Memory Index has been created successfully!")
 
 
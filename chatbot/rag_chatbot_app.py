@@ -12,7 +12,7 @@ from bot.conversation.ctx_strategy import (
     get_ctx_synthesis_strategies,
     get_ctx_synthesis_strategy,
 )
-from bot.memory.embedder import Embedder
+from bot.memory.embedder import get_embedder
 from bot.memory.vector_database.chroma import Chroma
 from bot.model.model_registry import get_model_settings, get_models
 from helpers.log import get_logger
@@ -52,7 +52,7 @@ def load_index(vector_store_path: Path) -> Chroma:
     Returns:
         Chroma: An instance of the Vector Database.
     """
-    embedding = Embedder()
+    embedding = get_embedder()
     index = Chroma(persist_directory=str(vector_store_path), embedding=embedding)
 
     return index
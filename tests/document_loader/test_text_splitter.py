@@ -1,5 +1,7 @@
+import pytest
 from document_loader.format import Format
 from document_loader.text_splitter import RecursiveCharacterTextSplitter, create_recursive_text_splitter
+from entities.document import Document
 
 
 def test_recursive_character_text_splitter_keep_separators() -> None:
@@ -26,6 +28,60 @@ def test_recursive_character_text_splitter_keep_separators() -> None:
     assert result == ["Apple", "banana", "orange and tomato"]
 
 
+def test_recursive_character_text_splitter_no_keep_separator_multi_level() -> None:
+    # The oversize word forces a descent to the character level; its fragments must pack with the
+    # neighbouring splits without fabricating "\n\n" or " " separators between characters.
+    text = "intro text\n\nsupercalifragilistic word here"
+    splitter = RecursiveCharacterTextSplitter(chunk_size=12, chunk_overlap=0, keep_separator=False)
+    assert splitter.split_text(text) == ["intro text", "supercalifra", "gilistic", "word here"]
+
+
+def test_recursive_character_text_splitter_start_indexes() -> None:
+    text = "Hi.\n\nI'm Harrison.\n\nHow? Are? You?\nOkay then f f f f."
+    splitter = RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=1)
+    chunks = splitter.split_text_with_start_indexes(text)
+    assert [chunk for chunk, _ in chunks] == splitter.split_text(text)
+    # Every reported start index points at the chunk's actual position in the text.
+    for chunk, start_index in chunks:
+        assert text[start_index : start_index + len(chunk)] == chunk
+
+
+def test_split_documents_parallel_matches_sequential() -> None:
+    documents = [
+        Document(page_content=f"Doc {i}.\n\nSome content for document number {i}.", metadata={"source": f"{i}.md"})
+        for i in range(20)
+    ]
+    splitter = RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=0)
+    # 20 documents cross the parallel threshold; the output must match splitting them one by one.
+    parallel = splitter.split_documents(documents)
+    sequential = [chunk for doc in documents for chunk in splitter.split_documents([doc])]
+    assert parallel == sequential
+
+
+def test_split_file_matches_split_text(tmp_path) -> None:
+    text = "Hi.\n\nI'm Harrison.\n\nHow? Are? You?\nOkay then f f f f.\n\nBye!\n\n-H."
+    file_path = tmp_path / "doc.md"
+    file_path.write_text(text)
+    splitter = RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=1)
+    assert list(splitter.split_file(file_path)) == splitter.split_text(text)
+    # Tiny blocks force several mmap windows, each cut at a blank-line boundary. Each chunk is a
+    # substring of the source; locating them in document order and marking the spans they cover
+    # proves no content is dropped or corrupted at the block boundaries.
+    chunked = list(splitter.split_file(file_path, block_size=16))
+    covered = [False] * len(text)
+    position = 0
+    for chunk in chunked:
+        position = text.index(chunk, position)
+        covered[position : position + len(chunk)] = [True] * len(chunk)
+    assert all(is_covered for char, is_covered in zip(text, covered) if not char.isspace())
+    assert all(len(chunk) <= 10 for chunk in chunked)
+
+
+def test_create_recursive_text_splitter_unsupported_backend() -> None:
+    with pytest.raises(ValueError):
+        create_recursive_text_splitter(format=Format.MARKDOWN.value, backend="go")
+
+
 def test_iterative_text_splitter() -> None:
     """Test iterative text splitter."""
     text = """Hi.\n\nI'm Harrison.\n\nHow? Are? You?\nOkay then f f f f.
@@ -35,11 +91,10 @@ Bye!\n\n-H."""
     splitter = RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=1)
     output = splitter.split_text(text)
     expected_output = [
-        "Hi.",
-        "I'm",
+        "Hi.\n\nI'm H",
         "Harrison.",
-        "How? Are?",
-        "You?",
+        "How?",
+        "Are? You?",
         "Okay then",
         "f f f f.",
         "This is a",
@@ -49,8 +104,8 @@ Bye!\n\n-H."""
         "but gotta",
         "test the",
         "splitting",
-        "gggg",
-        "some how.",
+        "gggg some",
+        "how.",
         "Bye!",
         "-H.",
     ]
@@ -98,22 +153,21 @@ b = 2
         "## Lists",
         "- Item 1",
         "- Item 2",
-        "- Item 3",
-        "### Horizontal",
+        "- Item 3\n\n###",
+        "Horizontal",
         "lines",
         "***********",
-        "____________",
-        "---------------",
-        "----",
-        "#### Code",
-        "blocks",
-        "```",
-        "This is a code",
-        "block",
+        "____________\n--",
+        "----------------",
+        "-\n\n#### Code",
+        "blocks\n```\nThis",
+        "is a code block",
         "# sample code",
         "a = 1\nb = 2",
         "```",
     ]
+    # Every chunk respects the requested chunk size.
+    assert all(len(chunk) <= 16 for chunk in chunks)
     # Special test for special characters
     code = "harry\n***\nbabylon is"
     chunks = splitter.split_text(code)